@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Randomized equivalence check for the chunker.
+
+Checks that iter_chunks, create_chunks and a straightforward reference
+implementation agree on random inputs, and that the chunks cover every
+word of the text.
+
+Usage:
+    python check_chunker.py [--runs 3000] [--seed 0]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+from chunker import create_chunks, iter_chunks, preprocess_text
+
+
+def reference_chunks(text, chunk_size, overlap):
+    """Chunk fully preprocessed text with plain string searches."""
+    if len(text) <= chunk_size:
+        return [(text, 0, len(text))]
+
+    chunks = []
+    position = 0
+    while position < len(text):
+        end_pos = min(position + chunk_size, len(text))
+        if end_pos < len(text):
+            end_pos = text.rfind(' ', position + 1, end_pos + 1)
+            if end_pos == -1:
+                end_pos = text.find(' ', position + chunk_size)
+                if end_pos == -1:
+                    end_pos = len(text)
+
+        if text[position:end_pos]:
+            chunks.append((text[position:end_pos], position, end_pos))
+        if end_pos >= len(text):
+            break
+
+        position = max(end_pos - overlap, position + 1)
+        space_pos = text.find(' ', position)
+        position = len(text) if space_pos == -1 else space_pos + 1
+
+    return chunks
+
+
+def random_text(rng):
+    """Build raw transcript-like text with uneven whitespace and long words."""
+    separators = [' ', ' ', ' ', '  ', '\n', '\n\n', '\t', ' \n ', '\xa0']
+    words = []
+    for _ in range(rng.randint(0, 400)):
+        if rng.random() < 0.02:
+            length = rng.randint(50, 400)
+        else:
+            length = rng.randint(1, 12)
+        words.append(''.join(rng.choice('abcdeé.,?!') for _ in range(length)))
+        words.append(rng.choice(separators))
+    text = ''.join(words)
+    if rng.random() < 0.5:
+        text = rng.choice(separators) + text
+    return text
+
+
+def check(raw, chunk_size, overlap, path):
+    """Return a description of the first mismatch, or None."""
+    text = preprocess_text(raw)
+    expected = reference_chunks(text, chunk_size, overlap)
+
+    created = list(zip(*create_chunks(text, chunk_size, overlap)))
+    if created != expected:
+        return "create_chunks differs from reference"
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(raw)
+    if list(iter_chunks(path, chunk_size, overlap)) != expected:
+        return "iter_chunks differs from reference"
+
+    covered = 0
+    for chunk_text, start, end in expected:
+        if text[start:end] != chunk_text:
+            return "chunk text doesn't match its positions"
+        # Chunks end on a space and the next one starts after it
+        if text[covered:start].strip():
+            return f"text {covered}-{start} is in no chunk"
+        covered = max(covered, end)
+    if text[covered:].strip():
+        return f"text {covered}-{len(text)} is in no chunk"
+
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        # A slab size of zero or less would end or defeat the stream
+        for chunk_size in (0, -1):
+            try:
+                list(iter_chunks(path, chunk_size, 0))
+            except ValueError:
+                continue
+            print(f"iter_chunks accepted chunk_size={chunk_size}", file=sys.stderr)
+            sys.exit(1)
+
+        for run in range(args.runs):
+            raw = random_text(rng)
+            chunk_size = rng.randint(1, 300)
+            overlap = rng.randint(0, chunk_size * 2)
+            problem = check(raw, chunk_size, overlap, path)
+            if problem:
+                print(f"Run {run}: {problem} "
+                      f"(chunk_size={chunk_size}, overlap={overlap}, raw={raw!r})",
+                      file=sys.stderr)
+                sys.exit(1)
+    finally:
+        os.remove(path)
+
+    print(f"{args.runs} random inputs OK")
+
+
+if __name__ == "__main__":
+    main()
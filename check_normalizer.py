@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Fixed-case check for the normalizer.
+
+Runs normalize_text over inputs with known outputs, including characters
+that change length or don't fold to plain ASCII when casefolded.
+
+Usage:
+    python check_normalizer.py
+"""
+
+import sys
+
+from normalizer import normalize_text
+
+CASES = [
+    ("we need to realize this", "we need to realise this"),
+    ("Realized, REALIZE and colors", "Realised, REALISE and colours"),
+    ("fern and dley said", "Vernon Dursley said"),
+    ("dley's house", "Dursley's house"),
+    ("colorful centers", "colorful centres"),
+    ("offenſe", "offence"),
+    ("straße colors", "straße colours"),
+    ("colorß color", "colorß colour"),
+    # İ (U+0130) and ı (U+0131) match "i" under re.IGNORECASE but don't
+    # casefold to it, so these are left alone rather than raising KeyError
+    ("we need to realİze this", "we need to realİze this"),
+    ("realıze the color", "realıze the colour"),
+    ("İ realize", "İ realise"),
+]
+
+
+def main():
+    failures = 0
+    for text, expected in CASES:
+        try:
+            result = normalize_text(text)
+        except Exception as e:
+            result = f"<{type(e).__name__}: {e}>"
+        if result != expected:
+            print(f"{text!r}: expected {expected!r}, got {result!r}",
+                  file=sys.stderr)
+            failures += 1
+
+    if failures:
+        sys.exit(1)
+
+    print(f"{len(CASES)} cases OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """Text preprocessing and chunking for transcript cleaner."""
 
-import re
-from typing import List, Tuple
+from array import array
+from typing import Iterator, List, Optional, TextIO, Tuple
 
 
 def preprocess_text(text: str) -> str:
@@ -14,116 +14,275 @@ def preprocess_text(text: str) -> str:
     Returns:
         Preprocessed text with normalized whitespace
     """
-    # Remove blank lines and normalize whitespace
-    lines = text.splitlines()
-    non_empty_lines = [line.strip() for line in lines if line.strip()]
+    # str.split() with no separator splits on runs of any whitespace
+    # (including newlines) and drops empty tokens, so a single join both
+    # removes blank lines and collapses whitespace
+    return ' '.join(text.split())
 
-    # Join with single spaces
-    text = ' '.join(non_empty_lines)
 
-    # Normalize multiple spaces to single space
-    text = re.sub(r'\s+', ' ', text)
+class _TextWindow:
+    """
+    In-memory counterpart of _NormalizedStream over preprocessed text.
 
-    return text.strip()
+    Exposes the same methods so _chunk_spans can chunk either source.
+    """
 
+    def __init__(self, text: str):
+        self.text = text
+        self.end = len(text)
+        self.eof = True
 
-def find_word_boundary(text: str, position: int, direction: str = 'backward') -> int:
-    """
-    Find the nearest word boundary from a position.
+    def ensure(self, position: int):
+        """The whole text is already available."""
 
-    Args:
-        text: The text to search
-        position: Starting position
-        direction: 'backward' or 'forward'
+    def discard_before(self, position: int):
+        """The whole text is kept."""
 
-    Returns:
-        Position of the nearest word boundary (space)
+    def slice(self, start: int, end: int) -> str:
+        """Return text[start:end]."""
+        return self.text[start:end]
+
+    def rfind_space(self, start: int, end: int) -> int:
+        """Return the last space in text[start:end], or -1 if there is none."""
+        return self.text.rfind(' ', start, end)
+
+    def find_space(self, start: int) -> int:
+        """Return the first space at or after start, or -1 if there is none."""
+        return self.text.find(' ', start)
+
+
+class _NormalizedStream:
     """
-    if direction == 'backward':
-        # Search backward for a space
-        while position > 0 and text[position] != ' ':
-            position -= 1
-        return position
-    else:
-        # Search forward for a space
-        while position < len(text) and text[position] != ' ':
-            position += 1
-        return position
+    Whitespace-normalized window onto a text file.
 
+    Reads the file in slabs and normalizes each one the same way as
+    preprocess_text, holding only the text between `base` and `end`.
+    Positions are offsets into the fully preprocessed text.
+    """
 
-def create_chunks(text: str, chunk_size: int = 9000, overlap: int = 500) -> List[Tuple[str, int, int]]:
+    def __init__(self, f: TextIO, slab_size: int):
+        self.f = f
+        self.slab_size = slab_size
+        self.text = ""
+        self.base = 0
+        self.eof = False
+        self._carry = ""
+
+    @property
+    def end(self) -> int:
+        """Position just past the last normalized character read so far."""
+        return self.base + len(self.text)
+
+    def _read_slab(self):
+        """Read and normalize the next slab, appending it to the window."""
+        slab = self.f.read(self.slab_size)
+        if not slab:
+            self.eof = True
+            words = self._carry.split()
+            self._carry = ""
+        else:
+            raw = self._carry + slab
+            words = raw.split()
+            # Hold back a word that may continue in the next slab
+            self._carry = words.pop() if words and not raw[-1].isspace() else ""
+
+        piece = ' '.join(words)
+        if piece:
+            self.text = f"{self.text} {piece}" if self.end else piece
+
+    def ensure(self, position: int):
+        """Read until the window reaches position or the file ends."""
+        while not self.eof and self.end < position:
+            self._read_slab()
+
+    def discard_before(self, position: int):
+        """Drop text before position that will not be needed again."""
+        if position > self.base:
+            self.text = self.text[position - self.base:]
+            self.base = position
+
+    def slice(self, start: int, end: int) -> str:
+        """Return preprocessed text[start:end]."""
+        self.ensure(end)
+        return self.text[start - self.base:end - self.base]
+
+    def rfind_space(self, start: int, end: int) -> int:
+        """Return the last space in text[start:end], or -1 if there is none."""
+        self.ensure(end)
+        idx = self.text.rfind(' ', start - self.base, end - self.base)
+        return idx if idx == -1 else idx + self.base
+
+    def find_space(self, start: int) -> int:
+        """Return the first space at or after start, or -1 if there is none."""
+        scan_from = start - self.base
+        while True:
+            idx = self.text.find(' ', scan_from)
+            if idx != -1:
+                return idx + self.base
+            if self.eof:
+                return -1
+            scan_from = max(scan_from, len(self.text))
+            self._read_slab()
+
+
+def _chunk_spans(window, chunk_size: int,
+                 overlap: int) -> Iterator[Tuple[str, int, int]]:
     """
-    Split text into overlapping chunks at word boundaries.
+    Split the text behind window into overlapping chunks at word boundaries.
 
     Args:
-        text: Preprocessed text to chunk
+        window: _TextWindow or _NormalizedStream over the preprocessed text
         chunk_size: Target size of each chunk in characters
         overlap: Number of characters to overlap between chunks
 
-    Returns:
-        List of tuples: (chunk_text, start_position, end_position)
+    Yields:
+        Tuples of (chunk_text, start_position, end_position)
     """
-    if len(text) <= chunk_size:
-        return [(text, 0, len(text))]
+    window.ensure(chunk_size + 1)
+    text_end = window.end
+    if window.eof and text_end <= chunk_size:
+        yield (window.text, 0, text_end)
+        return
 
-    chunks = []
     position = 0
 
-    while position < len(text):
+    while True:
+        # window.end is a computed property on _NormalizedStream, so read it
+        # once after each call that can extend the window
+        window.ensure(position + chunk_size + 1)
+        text_end = window.end
+        if window.eof and position >= text_end:
+            break
+
         # Calculate end position for this chunk
-        end_pos = min(position + chunk_size, len(text))
+        target_end = position + chunk_size
+        end_pos = min(target_end, text_end)
 
         # If we're not at the end, find a word boundary
-        if end_pos < len(text):
-            end_pos = find_word_boundary(text, end_pos, 'backward')
+        if end_pos < text_end:
+            end_pos = window.rfind_space(position + 1, end_pos + 1)
             # Make sure we made progress
-            if end_pos <= position:
-                end_pos = find_word_boundary(text, position + chunk_size, 'forward')
+            if end_pos == -1:
+                end_pos = window.find_space(target_end)
+                text_end = window.end
+                if end_pos == -1:
+                    end_pos = text_end
 
-        # Extract chunk
-        chunk_text = text[position:end_pos].strip()
+        # Extract chunk. Whitespace is already normalized and position and
+        # end_pos sit just after and on a space, so there is nothing to strip
+        chunk_text = window.slice(position, end_pos)
 
         if chunk_text:
-            chunks.append((chunk_text, position, end_pos))
+            yield (chunk_text, position, end_pos)
 
-        # Move position for next chunk, accounting for overlap
-        # The overlap ensures context continuity
-        if end_pos >= len(text):
+        if window.eof and end_pos >= text_end:
             break
 
-        # Next chunk starts (chunk_size - overlap) characters from current start
-        position = end_pos - overlap
+        # Next chunk starts overlap characters before this one ended, but
+        # always after this one started, so a chunk shorter than the
+        # overlap can't move position backwards or leave it in place
+        position = max(end_pos - overlap, position + 1)
 
         # Make sure we're at a word boundary
-        if position > 0:
-            position = find_word_boundary(text, position, 'forward')
-            if text[position] == ' ':
-                position += 1
+        space_pos = window.find_space(position)
+        position = window.end if space_pos == -1 else space_pos + 1
+
+        window.discard_before(position)
+
+
+def create_chunks(text: str, chunk_size: int = 9000,
+                  overlap: int = 500) -> Tuple[List[str], array, array]:
+    """
+    Split text into overlapping chunks at word boundaries.
+
+    Chunks are returned as parallel columns rather than a list of tuples;
+    zip(texts, starts, ends) gives the (text, start, end) view expected by
+    TranscriptProcessor.process_chunks. zip has no len(), so pass
+    total_chunks=len(texts) alongside it for accurate progress output.
+
+    Args:
+        text: Preprocessed text to chunk
+        chunk_size: Target size of each chunk in characters
+        overlap: Number of characters to overlap between chunks
 
-    return chunks
+    Returns:
+        Tuple of (chunk_texts, start_positions, end_positions)
+    """
+    texts = []
+    starts = array('q')
+    ends = array('q')
+
+    for chunk_text, start_pos, end_pos in _chunk_spans(
+            _TextWindow(text), chunk_size, overlap):
+        texts.append(chunk_text)
+        starts.append(start_pos)
+        ends.append(end_pos)
+
+    return texts, starts, ends
+
+
+def iter_chunks(file_path: str, chunk_size: int = 9000,
+                overlap: int = 500) -> Iterator[Tuple[str, int, int]]:
+    """
+    Stream overlapping chunks from a transcript file.
+
+    Produces the same chunks as create_chunks(preprocess_text(raw_text))
+    but reads the file incrementally, so memory use is proportional to
+    chunk_size rather than to the size of the file.
+
+    Args:
+        file_path: Path to the raw transcript file
+        chunk_size: Target size of each chunk in characters
+        overlap: Number of characters to overlap between chunks
+
+    Yields:
+        Tuples of (chunk_text, start_position, end_position)
+    """
+    # The file is read in slabs of 2 * chunk_size characters; f.read(0)
+    # would look like end of file and f.read(-n) would read it all at once
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        stream = _NormalizedStream(f, slab_size=chunk_size * 2)
+        yield from _chunk_spans(stream, chunk_size, overlap)
 
 
-def get_overlap_context(chunks: List[Tuple[str, int, int]],
-                        cleaned_chunks: List[str],
-                        current_index: int,
+def estimate_chunk_count(file_size: int, chunk_size: int = 9000,
+                         overlap: int = 500) -> int:
+    """
+    Estimate how many chunks a file will produce without reading it.
+
+    Args:
+        file_size: Size of the raw transcript file in bytes
+        chunk_size: Target size of each chunk in characters
+        overlap: Number of characters to overlap between chunks
+
+    Returns:
+        Approximate chunk count (at least 1)
+    """
+    if file_size <= chunk_size:
+        return 1
+    step = max(chunk_size - overlap, 1)
+    return -(-(file_size - overlap) // step)
+
+
+def get_overlap_context(previous_cleaned: Optional[str],
                         context_chars: int = 500) -> str:
     """
     Get the end of the previous cleaned chunk for context.
 
     Args:
-        chunks: List of original chunk tuples
-        cleaned_chunks: List of cleaned chunk texts
-        current_index: Index of current chunk being processed
+        previous_cleaned: Cleaned text of the previous chunk, or None if
+            this is the first chunk
         context_chars: Number of characters of context to include
 
     Returns:
         Context string from previous chunk, or empty string if first chunk
     """
-    if current_index == 0 or not cleaned_chunks:
+    if not previous_cleaned:
         return ""
 
-    previous_cleaned = cleaned_chunks[-1]
-
     # Get the last context_chars characters
     if len(previous_cleaned) <= context_chars:
         return previous_cleaned
@@ -131,11 +290,11 @@ def get_overlap_context(chunks: List[Tuple[str, int, int]],
     # Find a good break point (sentence or paragraph)
     context = previous_cleaned[-context_chars:]
 
-    # Try to start at a sentence boundary
-    sentence_ends = ['.', '!', '?']
-    for i, char in enumerate(context):
-        if char in sentence_ends and i < len(context) - 1:
-            # Start after this sentence
+    # Try to start after the first sentence boundary
+    sentence_ends = [pos for pos in (context.find(c) for c in '.!?') if pos != -1]
+    if sentence_ends:
+        i = min(sentence_ends)
+        if i < len(context) - 1:
             return context[i+1:].strip()
 
     # Fall back to word boundary
@@ -9,11 +9,12 @@ Usage:
 """
 
 import argparse
+import asyncio
 import os
 import sys
 from pathlib import Path
 
-from chunker import preprocess_text, create_chunks
+from chunker import iter_chunks, estimate_chunk_count
 from processor import TranscriptProcessor
 
 
@@ -82,7 +83,22 @@ Environment Variables:
         "--delay",
         type=float,
         default=1.0,
-        help="Delay between API calls in seconds (default: 1.0)"
+        help="Delay after each API call in seconds; with --no-context, "
+             "minimum spacing between call starts (default: 1.0)"
+    )
+
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=4,
+        help="Maximum number of API calls in flight (default: 4)"
+    )
+
+    parser.add_argument(
+        "--no-context",
+        action="store_true",
+        help="Don't send the previous cleaned chunk as context, "
+             "allowing chunks to be processed in parallel (forces --overlap 0)"
     )
 
     return parser.parse_args()
@@ -100,7 +116,7 @@ def get_output_path(input_path: str, output_path: str = None) -> str:
 def get_checkpoint_path(input_path: str) -> str:
     """Generate checkpoint file path."""
     input_p = Path(input_path)
-    return str(input_p.parent / f".{input_p.stem}_checkpoint.json")
+    return str(input_p.parent / f".{input_p.stem}_checkpoint.jsonl")
 
 
 def main():
@@ -112,6 +128,18 @@ def main():
         print(f"Error: Input file not found: {args.input_file}", file=sys.stderr)
         sys.exit(1)
 
+    if args.max_concurrent < 1:
+        print("Error: --max-concurrent must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    if args.chunk_size < 1:
+        print("Error: --chunk-size must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    if args.overlap < 0:
+        print("Error: --overlap must not be negative", file=sys.stderr)
+        sys.exit(1)
+
     # Check for API key
     api_key = args.api_key or os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
@@ -122,6 +150,11 @@ def main():
     # Determine output path
     output_path = get_output_path(args.input_file, args.output)
 
+    # Only the context prompt tells the model not to repeat the overlap, so
+    # without context overlapping text would be cleaned and output twice
+    if args.no_context:
+        args.overlap = 0
+
     # Checkpoint path for resuming
     checkpoint_path = get_checkpoint_path(args.input_file) if args.resume else None
 
@@ -131,33 +164,17 @@ def main():
         print(f"Chunk size: {args.chunk_size}, Overlap: {args.overlap}")
         print()
 
-    # Read input file
-    if args.verbose:
-        print("Reading input file...")
-
-    with open(args.input_file, 'r', encoding='utf-8') as f:
-        raw_text = f.read()
-
-    if args.verbose:
-        print(f"Read {len(raw_text):,} characters")
-
-    # Preprocess text
+    # Stream chunks from the input file
     if args.verbose:
-        print("Preprocessing text...")
+        print("Streaming chunks from input file...")
 
-    processed_text = preprocess_text(raw_text)
-
-    if args.verbose:
-        print(f"Preprocessed to {len(processed_text):,} characters")
-
-    # Create chunks
-    if args.verbose:
-        print("Creating chunks...")
-
-    chunks = create_chunks(processed_text, args.chunk_size, args.overlap)
+    chunks = iter_chunks(args.input_file, args.chunk_size, args.overlap)
+    estimated_chunks = estimate_chunk_count(
+        os.path.getsize(args.input_file), args.chunk_size, args.overlap
+    )
 
     if args.verbose:
-        print(f"Created {len(chunks)} chunks")
+        print(f"Expecting about {estimated_chunks} chunks")
         print()
 
     # Initialize processor
@@ -172,11 +189,14 @@ def main():
         print("-" * 40)
 
     try:
-        cleaned_chunks = processor.process_chunks(
+        cleaned_chunks = asyncio.run(processor.process_chunks(
             chunks,
             verbose=args.verbose,
-            delay_between_calls=args.delay
-        )
+            delay_between_calls=args.delay,
+            max_concurrent=args.max_concurrent,
+            use_context=not args.no_context,
+            total_chunks=estimated_chunks
+        ))
     except KeyboardInterrupt:
         print("\nInterrupted! Progress saved to checkpoint.", file=sys.stderr)
         if args.resume:
@@ -0,0 +1,173 @@
+"""Deterministic text corrections for transcript cleaner."""
+
+import re
+from typing import List, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Fixed corrections applied locally to cleaned text, so the model doesn't
+# spend tokens on them. Keys are lowercase; matching is case-insensitive.
+# Context-dependent fixes stay in SYSTEM_PROMPT.
+_SUBSTITUTIONS = {
+    # Speech-to-text errors
+    "forly": "thoroughly",
+    "trends rights": "trans rights",
+    "fern and dley": "Vernon Dursley",
+    "dley": "Dursley",
+    "trone": "Trelawney",
+    "trani": "Trelawney",
+    "hamayan": "Hermione",
+    "hamay": "Hermione",
+    "hayan": "Hermione",
+    "alus": "Albus",
+    "slivering": "Slytherin",
+    "jk rowlings": "J.K. Rowling's",
+
+    # British English spellings
+    "fueled": "fuelled",
+    "fueling": "fuelling",
+    "behavior": "behaviour",
+    "behaviors": "behaviours",
+    "color": "colour",
+    "colors": "colours",
+    "colored": "coloured",
+    "realize": "realise",
+    "realized": "realised",
+    "realizes": "realises",
+    "realizing": "realising",
+    "organize": "organise",
+    "organized": "organised",
+    "organizes": "organises",
+    "organizing": "organising",
+    "center": "centre",
+    "centers": "centres",
+    "theater": "theatre",
+    "theaters": "theatres",
+    "defense": "defence",
+    "offense": "offence",
+    "analyze": "analyse",
+    "analyzed": "analysed",
+    "analyzes": "analyses",
+    "analyzing": "analysing",
+}
+
+# Longest keys first so multi-word phrases win over words they contain.
+# Matched against casefolded text, like the automaton, so both paths share
+# one folding rule and every match is itself a key.
+_SUB_RE = re.compile(
+    r'\b(' + '|'.join(
+        re.escape(key) for key in sorted(_SUBSTITUTIONS, key=len, reverse=True)
+    ) + r')\b'
+)
+
+
+def _substitute(found: str, key: str) -> str:
+    """Look up the replacement for key, keeping the capitalisation of found."""
+    replacement = _SUBSTITUTIONS[key]
+    if found.isupper():
+        return replacement.upper()
+    if found[0].isupper():
+        return replacement[0].upper() + replacement[1:]
+    return replacement
+
+
+_AUTOMATON = None
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _key in _SUBSTITUTIONS:
+        _AUTOMATON.add_word(_key, _key)
+    _AUTOMATON.make_automaton()
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex definition of a word character."""
+    return char.isalnum() or char == '_'
+
+
+def _fold(text: str) -> Tuple[str, Optional[List[int]]]:
+    """
+    Casefold text, mapping folded offsets back to offsets in text.
+
+    Returns:
+        Tuple of (folded_text, offsets). offsets is None when folding kept
+        the length, so offsets are shared; otherwise offsets[i] is the
+        position in text of the character folded_text[i] came from, with
+        one extra entry for the end of the text.
+    """
+    folded = text.casefold()
+    if len(folded) == len(text):
+        return folded, None
+
+    # Some characters change length when casefolded, e.g. "ß" -> "ss" and
+    # "İ" -> "i̇"
+    offsets = []
+    for index, char in enumerate(text):
+        offsets.extend([index] * len(char.casefold()))
+    offsets.append(len(text))
+    return folded, offsets
+
+
+def _automaton_spans(folded: str) -> List[Tuple[int, int]]:
+    """
+    Find substitution spans in folded text with a single Aho-Corasick pass.
+
+    Mirrors _SUB_RE: matches must sit on word boundaries, and overlapping
+    matches are resolved leftmost-longest.
+    """
+    matches = []
+    for end, key in _AUTOMATON.iter(folded):
+        start = end - len(key) + 1
+        if start > 0 and _is_word_char(folded[start - 1]):
+            continue
+        if end + 1 < len(folded) and _is_word_char(folded[end + 1]):
+            continue
+        matches.append((start, end + 1))
+
+    matches.sort(key=lambda span: (span[0], -span[1]))
+
+    spans = []
+    position = 0
+    for start, end in matches:
+        if start < position:
+            continue
+        spans.append((start, end))
+        position = end
+    return spans
+
+
+def normalize_text(text: str) -> str:
+    """
+    Apply fixed transcription and British spelling corrections.
+
+    Args:
+        text: Cleaned transcript text
+
+    Returns:
+        Text with all known substitutions applied in a single pass
+    """
+    folded, offsets = _fold(text)
+    if _AUTOMATON is not None:
+        spans = _automaton_spans(folded)
+    else:
+        spans = [match.span() for match in _SUB_RE.finditer(folded)]
+
+    parts = []
+    position = 0
+    for start, end in spans:
+        key = folded[start:end]
+        if offsets is not None:
+            # Skip matches that begin or end partway through the folded
+            # form of a single character
+            if ((start and offsets[start - 1] == offsets[start])
+                    or offsets[end - 1] == offsets[end]):
+                continue
+            start, end = offsets[start], offsets[end]
+        parts.append(text[position:start])
+        parts.append(_substitute(text[start:end], key))
+        position = end
+    parts.append(text[position:])
+
+    return ''.join(parts)
@@ -1,25 +1,65 @@
 """API interaction and processing logic for transcript cleaner."""
 
+import asyncio
+import itertools
 import json
 import os
-import time
+import random
 from pathlib import Path
-from typing import List, Optional, Tuple, Callable
+from typing import Callable, Iterable, List, Optional, Sized, Tuple
 
 import anthropic
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
-)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from prompts import (
     SYSTEM_PROMPT,
-    USER_PROMPT_TEMPLATE,
-    USER_PROMPT_WITH_CONTEXT_TEMPLATE
+    USER_PROMPT_PREFIX,
+    USER_PROMPT_WITH_CONTEXT_PREFIX,
+    USER_PROMPT_WITH_CONTEXT_MIDDLE
 )
 from chunker import get_overlap_context
+from normalizer import normalize_text
+
+# Errors worth retrying, and how many attempts to make in total
+_RETRYABLE_ERRORS = (
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError
+)
+_MAX_ATTEMPTS = 5
+
+# Overloaded responses. Newer SDKs raise these as OverloadedError, which
+# is not an InternalServerError, so they are matched by status code
+_OVERLOADED_STATUS = 529
+
+# Upper bound on generated tokens for a single chunk
+_MAX_OUTPUT_TOKENS = 16000
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a checkpoint record, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse a checkpoint record, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_retryable(error: anthropic.APIError) -> bool:
+    """Whether a failed API call is worth retrying."""
+    if isinstance(error, _RETRYABLE_ERRORS):
+        return True
+    return (isinstance(error, anthropic.APIStatusError)
+            and error.status_code == _OVERLOADED_STATUS)
 
 
 class TranscriptProcessor:
@@ -39,7 +79,7 @@ class TranscriptProcessor:
             model: Model to use for processing.
             checkpoint_file: Path to checkpoint file for resuming interrupted runs.
         """
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = anthropic.AsyncAnthropic(api_key=api_key)
         self.model = model
         self.checkpoint_file = checkpoint_file
         self.temperature = 0.0
@@ -47,25 +87,17 @@ class TranscriptProcessor:
     def _create_user_prompt(self, text: str, context: str = "") -> str:
         """Create the user prompt with optional context."""
         if context:
-            return USER_PROMPT_WITH_CONTEXT_TEMPLATE.format(
-                context=context,
-                text=text
-            )
-        return USER_PROMPT_TEMPLATE.format(text=text)
-
-    @retry(
-        retry=retry_if_exception_type((
-            anthropic.RateLimitError,
-            anthropic.APIConnectionError,
-            anthropic.InternalServerError
-        )),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        stop=stop_after_attempt(5)
-    )
-    def _call_api(self, text: str, context: str = "") -> str:
+            return (USER_PROMPT_WITH_CONTEXT_PREFIX + context
+                    + USER_PROMPT_WITH_CONTEXT_MIDDLE + text)
+        return USER_PROMPT_PREFIX + text
+
+    async def _call_api(self, text: str, context: str = "") -> str:
         """
         Make an API call with retry logic.
 
+        Transient errors are retried with exponential backoff and jitter,
+        up to _MAX_ATTEMPTS attempts in total.
+
         Args:
             text: Text to clean
             context: Optional context from previous chunk
@@ -75,92 +107,253 @@ class TranscriptProcessor:
         """
         user_prompt = self._create_user_prompt(text, context)
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=16000,
-            temperature=self.temperature,
-            system=SYSTEM_PROMPT,
-            messages=[
-                {"role": "user", "content": user_prompt}
-            ]
-        )
-
-        return response.content[0].text
+        # Cleaned output is about as long as the input, and a token is
+        # roughly 3-4 characters, so cap generation a little above that to
+        # stop runaway output on malformed chunks
+        max_tokens = min(_MAX_OUTPUT_TOKENS, len(text) // 3 + 1024)
+
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                message = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=max_tokens,
+                    temperature=self.temperature,
+                    system=[
+                        {
+                            "type": "text",
+                            "text": SYSTEM_PROMPT,
+                            # Only cached once the prompt reaches the model's
+                            # minimum cacheable length (1024 tokens for Sonnet)
+                            "cache_control": {"type": "ephemeral"}
+                        }
+                    ],
+                    messages=[
+                        {"role": "user", "content": user_prompt}
+                    ]
+                )
+            except anthropic.APIError as error:
+                if not _is_retryable(error) or attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(min(60, 4 * 2 ** attempt) + random.uniform(0, 1))
+                continue
+
+            if (message.stop_reason == "max_tokens"
+                    and max_tokens < _MAX_OUTPUT_TOKENS
+                    and attempt < _MAX_ATTEMPTS - 1):
+                # The estimate was too tight; retry with the full budget
+                # rather than return a truncated chunk
+                max_tokens = _MAX_OUTPUT_TOKENS
+                continue
+
+            return message.content[0].text
 
     def _load_checkpoint(self) -> Tuple[List[str], int]:
         """
         Load checkpoint if it exists.
 
+        The checkpoint is a JSON-lines file with one record per cleaned
+        chunk, so it can be appended to rather than rewritten. Chunks may
+        finish out of order, so only the contiguous run from chunk 0 is
+        resumed; anything after a gap is processed again. Lines that don't
+        parse are skipped, and a partial tail is truncated so the next
+        append starts on a fresh line.
+
         Returns:
             Tuple of (cleaned_chunks, next_index_to_process)
         """
         if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
             return [], 0
 
-        with open(self.checkpoint_file, 'r') as f:
-            data = json.load(f)
-            return data.get('cleaned_chunks', []), data.get('next_index', 0)
-
-    def _save_checkpoint(self, cleaned_chunks: List[str], next_index: int):
-        """Save checkpoint to file."""
+        records = {}
+        # Byte offset just past the last record that parsed
+        good_end = 0
+        offset = 0
+        missing_newline = False
+        with open(self.checkpoint_file, 'rb') as f:
+            for line in f:
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    # A run interrupted mid-write leaves a partial line,
+                    # which may end mid-character. ValueError covers both
+                    # JSONDecodeError and UnicodeDecodeError. Keep reading
+                    # so one bad line can't hide the records after it
+                    continue
+                records[record['i']] = record['text']
+                good_end = offset
+                missing_newline = not line.endswith(b'\n')
+
+        # Cut off a partial tail so the next append starts on a fresh line
+        # rather than being glued onto it
+        if good_end < offset or missing_newline:
+            with open(self.checkpoint_file, 'r+b') as f:
+                f.truncate(good_end)
+                if missing_newline:
+                    f.seek(good_end)
+                    f.write(b'\n')
+
+        cleaned_chunks = []
+        while len(cleaned_chunks) in records:
+            cleaned_chunks.append(records[len(cleaned_chunks)])
+        return cleaned_chunks, len(cleaned_chunks)
+
+    def _save_checkpoint(self, index: int, cleaned_text: str):
+        """Append a cleaned chunk to the checkpoint file."""
         if not self.checkpoint_file:
             return
 
-        with open(self.checkpoint_file, 'w') as f:
-            json.dump({
-                'cleaned_chunks': cleaned_chunks,
-                'next_index': next_index
-            }, f)
+        with open(self.checkpoint_file, 'ab') as f:
+            f.write(_dumps({'i': index, 'text': cleaned_text}) + b'\n')
 
-    def process_chunks(
+    async def process_chunks(
         self,
-        chunks: List[Tuple[str, int, int]],
+        chunks: Iterable[Tuple[str, int, int]],
         verbose: bool = False,
         progress_callback: Optional[Callable[[int, int], None]] = None,
-        delay_between_calls: float = 1.0
+        delay_between_calls: float = 1.0,
+        max_concurrent: int = 4,
+        use_context: bool = True,
+        total_chunks: Optional[int] = None
     ) -> List[str]:
         """
         Process all chunks through the API.
 
+        Requests run concurrently, capped at max_concurrent in flight. When
+        use_context is set, each chunk waits for the previous chunk to be
+        cleaned so its tail can be sent as context, which keeps the calls
+        effectively sequential; without context all chunks run in parallel.
+
+        Chunks are pulled from the iterable only as slots free up, so a
+        generator such as chunker.iter_chunks is never fully materialized.
+
         Args:
-            chunks: List of (text, start, end) tuples
+            chunks: Iterable of (text, start, end) tuples, e.g.
+                chunker.iter_chunks, or zip(texts, starts, ends) from
+                chunker.create_chunks with total_chunks=len(texts)
             verbose: Whether to print progress
             progress_callback: Optional callback(current, total) for progress
-            delay_between_calls: Seconds to wait between API calls
+            delay_between_calls: Seconds to wait after each API call finishes
+                before starting the next; without context, the minimum
+                spacing between call starts
+            max_concurrent: Maximum number of API calls in flight
+            use_context: Whether to send the previous cleaned chunk as context
+            total_chunks: Chunk count (or estimate) for progress output,
+                used when chunks has no len(), as with iter_chunks or zip
 
         Returns:
             List of cleaned chunk texts
+
+        Raises:
+            ValueError: If max_concurrent is less than 1
         """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
+        cleaned_chunks: List[Optional[str]]
         cleaned_chunks, start_index = self._load_checkpoint()
 
         if start_index > 0 and verbose:
             print(f"Resuming from checkpoint at chunk {start_index + 1}")
 
-        total_chunks = len(chunks)
-
-        for i in range(start_index, total_chunks):
-            chunk_text, start_pos, end_pos = chunks[i]
+        if isinstance(chunks, Sized):
+            total_chunks = len(chunks)
+            total_label = str(total_chunks)
+        else:
+            total_chunks = total_chunks or 0
+            total_label = f"~{total_chunks}"
+
+        # ready[i] is set once chunk i has been cleaned
+        ready = [asyncio.Event() for _ in range(start_index)]
+        for event in ready:
+            event.set()
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+        pace_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        last_call = -delay_between_calls
+
+        async def pace():
+            # Space out calls to avoid rate limits. last_call is when the
+            # previous call started, or with context, when it finished
+            nonlocal last_call
+            async with pace_lock:
+                wait = last_call + delay_between_calls - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                last_call = loop.time()
+
+        async def process_one(i: int, chunk: Tuple[str, int, int]):
+            nonlocal last_call
+            chunk_text, start_pos, end_pos = chunk
+
+            # Fix known transcription errors before the model sees them
+            chunk_text = normalize_text(chunk_text)
+
+            # Get context from previous cleaned chunk. It's computed once
+            # here, so retries inside _call_api reuse it
+            previous_cleaned = None
+            if use_context and i > 0:
+                await ready[i - 1].wait()
+                previous_cleaned = cleaned_chunks[i - 1]
+            context = get_overlap_context(previous_cleaned)
+
+            await pace()
 
             if verbose:
-                print(f"Processing chunk {i + 1}/{total_chunks} "
+                print(f"Processing chunk {i + 1}/{total_label} "
                       f"(chars {start_pos}-{end_pos})...")
 
             if progress_callback:
                 progress_callback(i + 1, total_chunks)
 
-            # Get context from previous cleaned chunk
-            context = get_overlap_context(chunks, cleaned_chunks, i)
-
             # Call the API
-            cleaned_text = self._call_api(chunk_text, context)
-            cleaned_chunks.append(cleaned_text)
+            cleaned_text = await self._call_api(chunk_text, context)
 
-            # Save checkpoint after each successful chunk
-            self._save_checkpoint(cleaned_chunks, i + 1)
+            if use_context:
+                # Calls run one after another here, so measure the delay
+                # from when this one finished rather than when it started
+                last_call = loop.time()
 
-            # Delay between calls to avoid rate limits
-            if i < total_chunks - 1:
-                time.sleep(delay_between_calls)
+            # Catch any American spellings the model introduced, and strip
+            # so merge_chunks can join without collapsing blank lines
+            cleaned_text = normalize_text(cleaned_text).strip()
+
+            cleaned_chunks[i] = cleaned_text
+            ready[i].set()
+
+            # Save checkpoint after each successful chunk
+            self._save_checkpoint(i, cleaned_text)
+
+        failed = False
+
+        async def run_one(i: int, chunk: Tuple[str, int, int]):
+            nonlocal failed
+            try:
+                await process_one(i, chunk)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                semaphore.release()
+
+        tasks = []
+        remaining = itertools.islice(chunks, start_index, None)
+        for i, chunk in enumerate(remaining, start=start_index):
+            # Wait for a free slot before pulling the next chunk
+            await semaphore.acquire()
+            if failed:
+                # Stop feeding new chunks; gather below re-raises the error
+                semaphore.release()
+                break
+
+            cleaned_chunks.append(None)
+            ready.append(asyncio.Event())
+            tasks.append(asyncio.create_task(run_one(i, chunk)))
+
+        await asyncio.gather(*tasks)
 
         return cleaned_chunks
 
@@ -178,18 +371,7 @@ class TranscriptProcessor:
         Returns:
             Merged final text
         """
-        if not cleaned_chunks:
-            return ""
-
-        if len(cleaned_chunks) == 1:
-            return cleaned_chunks[0]
-
-        # Join chunks with paragraph breaks
+        # Join chunks with paragraph breaks. Chunks are stripped as they
+        # are cleaned, so the join can't produce runs of blank lines.
         # The overlap context helps ensure continuity, so simple joining works
-        merged = "\n\n".join(cleaned_chunks)
-
-        # Clean up any excessive newlines
-        import re
-        merged = re.sub(r'\n{3,}', '\n\n', merged)
-
-        return merged.strip()
+        return "\n\n".join(chunk for chunk in cleaned_chunks if chunk)
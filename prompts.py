@@ -113,30 +113,11 @@ SYSTEM_PROMPT = f"""You are a transcript editor. Your task is to clean up auto-g
    - Fix "I" when used as a pronoun
 
 3. **Speech-to-text errors**: Fix common transcription mistakes:
-   - "forly" → "thoroughly"
-   - "Trends rights" → "trans rights"
-   - "dley" → "Dursley"
-   - "Fern and dley" → "Vernon Dursley"
-   - "trone" or "trani" → "Trelawney"
-   - "hamayan" or "hamay" or "hayan" → "Hermione"
-   - "alus" → "Albus"
-   - "slivering" → "Slytherin"
    - "sweeping" or "sweep" (when about candy/sweet) → "sweet"
-   - "JK rowlings" → "J.K. Rowling's"
    - Use context to identify and fix other transcription errors
 
 4. **British English**: Use British spellings:
-   - "fueled" → "fuelled"
-   - "behavior" → "behaviour"
-   - "color" → "colour"
-   - "realize" → "realise"
-   - "organize" → "organise"
-   - "center" → "centre"
-   - "theater" → "theatre"
-   - "defense" → "defence"
-   - "offense" → "offence"
    - "license" (verb) → "licence" (noun)
-   - "analyze" → "analyse"
 
 5. **Proper nouns**: Fix Harry Potter proper nouns using this reference list:
 {HARRY_POTTER_PROPER_NOUNS}
@@ -154,16 +135,20 @@ SYSTEM_PROMPT = f"""You are a transcript editor. Your task is to clean up auto-g
 
 Output ONLY the cleaned transcript text, nothing else. No explanations, no notes."""
 
-USER_PROMPT_TEMPLATE = """Clean the following transcript segment:
+# User prompts are assembled by concatenating these pieces with the
+# context and text, which avoids str.format parsing on every call
+USER_PROMPT_PREFIX = """Clean the following transcript segment:
 
-{text}"""
+"""
 
-USER_PROMPT_WITH_CONTEXT_TEMPLATE = """Clean the following transcript segment. For context, here is the end of the previous segment (already cleaned):
+USER_PROMPT_WITH_CONTEXT_PREFIX = """Clean the following transcript segment. For context, here is the end of the previous segment (already cleaned):
 
 ---PREVIOUS CONTEXT---
-{context}
+"""
+
+USER_PROMPT_WITH_CONTEXT_MIDDLE = """
 ---END CONTEXT---
 
 Now clean this segment (do NOT repeat the context in your output):
 
-{text}"""
+"""